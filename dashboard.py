@@ -9,9 +9,30 @@ This script provides a basic dashboard to view:
 """
 
 import os
+import sys
 import json
+import asyncio
 from datetime import datetime, timedelta
-from src import ConfigManager, GitHubClient
+import numpy as np
+from src import ConfigManager, GitHubClient, IssueTable
+
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _flag_old(created_ts, cutoff_ts):
+        return created_ts <= cutoff_ts
+except ImportError:
+    def _flag_old(created_ts, cutoff_ts):
+        return created_ts <= cutoff_ts
+
+
+def flag_old_issues(table, threshold_days, now):
+    """Return a boolean mask over the table marking issues older than the
+    threshold, computed as one vectorized comparison (JIT-compiled when
+    Numba is installed)."""
+    cutoff_ts = int(now.timestamp()) - threshold_days * 86400
+    return _flag_old(table.created_ts, cutoff_ts)
 
 
 def print_header(title):
@@ -21,17 +42,15 @@ def print_header(title):
     print(f"{'='*60}")
 
 
-def get_repo_status(config):
+def get_repo_status(github_client, config, repo_info=None):
     """Get current repository status."""
     print_header("Repository Status")
-    
+
     try:
-        github_client = GitHubClient(config['repository']['token'])
-        repo_info = github_client.get_repo_info(
-            config['repository']['owner'],
-            config['repository']['name']
-        )
-        
+        if repo_info is None:
+            repo = config['repository']
+            repo_info = github_client.get_repo_info(repo['owner'], repo['name'])
+
         print(f"Repository: {repo_info['full_name']}")
         print(f"Description: {repo_info['description'] or 'No description'}")
         print(f"Open Issues: {repo_info['open_issues_count']}")
@@ -46,35 +65,41 @@ def get_repo_status(config):
         return None
 
 
-def get_current_issues(config):
+def get_current_issues(github_client, config, issues=None):
     """Get current open issues."""
     print_header("Current Open Issues")
-    
+
     try:
-        github_client = GitHubClient(config['repository']['token'])
-        issues = github_client.get_open_issues(
-            config['repository']['owner'],
-            config['repository']['name']
-        )
-        
+        if issues is None:
+            repo = config['repository']
+            issues = github_client.get_open_issues(repo['owner'], repo['name'])
+
         if not issues:
             print("✅ No open issues found")
             return []
         
         threshold_days = config['monitoring']['issue_threshold_days']
-        old_issues = []
-        
-        for issue in issues:
-            age_days = issue.age_days
-            status = "⚠️  OLD" if age_days >= threshold_days else "✅ Recent"
-            print(f"#{issue.number}: {issue.title}")
-            print(f"  Age: {age_days} days | Status: {status}")
-            print(f"  Labels: {', '.join([label['name'] for label in issue.labels])}")
-            print(f"  Assignees: {', '.join([assignee['login'] for assignee in issue.assignees])}")
-            print()
-            
-            if age_days >= threshold_days:
-                old_issues.append(issue)
+
+        # One clock read for the whole render instead of one per age lookup,
+        # with ages and the threshold mask computed as vectorized column ops
+        now = datetime.now()
+        table = IssueTable.from_issues(issues)
+        ages = table.age_days(now)
+        old_flags = flag_old_issues(table, threshold_days, now)
+
+        # Accumulate the section into one buffered write instead of
+        # several print() calls per issue
+        lines = []
+        for i in range(len(table)):
+            status = "⚠️  OLD" if old_flags[i] else "✅ Recent"
+            lines.append(f"#{table.numbers[i]}: {table.titles[i]}")
+            lines.append(f"  Age: {ages[i]} days | Status: {status}")
+            lines.append(f"  Labels: {table.labels_str[i]}")
+            lines.append(f"  Assignees: {table.assignees_str[i]}")
+            lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+        old_issues = [issues[i] for i in np.flatnonzero(old_flags)]
         
         if old_issues:
             print(f"⚠️  {len(old_issues)} issues exceed the {threshold_days}-day threshold")
@@ -86,32 +111,36 @@ def get_current_issues(config):
         return []
 
 
-def get_recent_prs(config):
+def get_recent_prs(github_client, config, prs=None):
     """Get recent pull request activity."""
     print_header("Recent Pull Request Activity")
-    
+
     try:
-        github_client = GitHubClient(config['repository']['token'])
-        prs = github_client.get_recent_prs(
-            config['repository']['owner'],
-            config['repository']['name'],
-            config['monitoring']['pr_lookback_hours']
-        )
-        
+        if prs is None:
+            repo = config['repository']
+            prs = github_client.get_recent_prs(
+                repo['owner'], repo['name'],
+                config['monitoring']['pr_lookback_hours']
+            )
+
         if not prs:
             print("📭 No recent PR activity found")
             return []
         
+        lines = []
         for pr in prs:
             status = "✅ Merged" if pr.is_merged else "❌ Closed" if pr.closed_at else "⏳ Open"
-            print(f"#{pr.number}: {pr.title}")
-            print(f"  Status: {status}")
+            lines.append(f"#{pr.number}: {pr.title}")
+            lines.append(f"  Status: {status}")
             if pr.merged_at:
-                print(f"  Merged: {pr.merged_at.strftime('%Y-%m-%d %H:%M')}")
+                lines.append(f"  Merged: {pr.merged_at.strftime('%Y-%m-%d %H:%M')}")
             elif pr.closed_at:
-                print(f"  Closed: {pr.closed_at.strftime('%Y-%m-%d %H:%M')}")
-            print(f"  Labels: {', '.join([label['name'] for label in pr.labels])}")
-            print()
+                lines.append(f"  Closed: {pr.closed_at.strftime('%Y-%m-%d %H:%M')}")
+            labels_str = pr.labels_str if pr.labels_str is not None \
+                else ', '.join(label['name'] for label in pr.labels)
+            lines.append(f"  Labels: {labels_str}")
+            lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
         
         return prs
         
@@ -124,24 +153,27 @@ def show_config_summary(config):
     """Show configuration summary."""
     print_header("Configuration Summary")
     
-    print(f"Repository: {config['repository']['owner']}/{config['repository']['name']}")
-    print(f"Issue Threshold: {config['monitoring']['issue_threshold_days']} days")
-    print(f"Check Interval: Every {config['monitoring']['check_interval_hours']} hours")
-    print(f"PR Lookback: {config['monitoring']['pr_lookback_hours']} hours")
-    print(f"Email Recipients: {', '.join(config['email']['recipients'])}")
-    print(f"SMTP Server: {config['email']['smtp_host']}:{config['email']['smtp_port']}")
+    repo, monitoring, email = config['repository'], config['monitoring'], config['email']
+    print(f"Repository: {repo['owner']}/{repo['name']}")
+    print(f"Issue Threshold: {monitoring['issue_threshold_days']} days")
+    print(f"Check Interval: Every {monitoring['check_interval_hours']} hours")
+    print(f"PR Lookback: {monitoring['pr_lookback_hours']} hours")
+    print(f"Email Recipients: {', '.join(email['recipients'])}")
+    print(f"SMTP Server: {email['smtp_host']}:{email['smtp_port']}")
 
 
 def show_next_actions(issues, threshold_days):
     """Show recommended next actions."""
     print_header("Recommended Actions")
     
-    old_issues = [issue for issue in issues if issue.age_days >= threshold_days]
-    
+    now = datetime.now()
+    old_issues = [(issue, (now - issue.created_at).days) for issue in issues
+                  if (now - issue.created_at).days >= threshold_days]
+
     if old_issues:
         print(f"🚨 {len(old_issues)} issues need attention:")
-        for issue in old_issues:
-            print(f"  - #{issue.number}: {issue.title} ({issue.age_days} days old)")
+        for issue, age_days in old_issues:
+            print(f"  - #{issue.number}: {issue.title} ({age_days} days old)")
         print("\n💡 Consider:")
         print("  - Assigning issues to team members")
         print("  - Adding priority labels")
@@ -154,27 +186,75 @@ def show_next_actions(issues, threshold_days):
     print("  - Recently merged/closed pull requests")
 
 
-def main():
+async def fetch_dashboard_data(github_client, config):
+    """Fetch repo info, issues and PRs concurrently via the REST API.
+
+    The three fetches are independent and network-bound, so running them
+    in parallel collapses wall time from the sum of the round trips to
+    the slowest one. Failed fetches are returned as None so the caller
+    can surface the error per section.
+    """
+    owner, name = config['repository']['owner'], config['repository']['name']
+    results = await asyncio.gather(
+        asyncio.to_thread(github_client.get_repo_info, owner, name),
+        asyncio.to_thread(github_client.get_open_issues, owner, name),
+        asyncio.to_thread(
+            github_client.get_recent_prs, owner, name,
+            config['monitoring']['pr_lookback_hours']
+        ),
+        return_exceptions=True
+    )
+
+    cleaned = []
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"⚠️  Fetch failed: {result}")
+            cleaned.append(None)
+        else:
+            cleaned.append(result)
+    return tuple(cleaned)
+
+
+async def main():
     """Main dashboard function."""
     print("📊 Repository Monitor Email Agent - Dashboard")
     print(f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
-        # Load configuration
+        # Load configuration once and share a single GitHub client across sections
         config_manager = ConfigManager()
         config = config_manager.load_config()
-        
+        github_client = GitHubClient(config['repository']['token'])
+
         # Show configuration summary
         show_config_summary(config)
-        
+
+        # Fetch everything in one GraphQL round trip; fall back to the
+        # three separate REST calls if the query fails
+        repo = config['repository']
+        snapshot = None
+        try:
+            snapshot = github_client.graphql_dashboard_snapshot(
+                repo['owner'], repo['name'],
+                config['monitoring']['pr_lookback_hours']
+            )
+        except Exception as e:
+            print(f"⚠️  GraphQL snapshot failed, falling back to REST: {e}")
+
+        if snapshot:
+            repo_data, issue_data, pr_data = snapshot
+        else:
+            # Fall back to the three REST calls, issued concurrently
+            repo_data, issue_data, pr_data = await fetch_dashboard_data(github_client, config)
+
         # Get repository status
-        repo_info = get_repo_status(config)
-        
+        repo_info = get_repo_status(github_client, config, repo_data)
+
         # Get current issues
-        issues = get_current_issues(config)
-        
+        issues = get_current_issues(github_client, config, issue_data)
+
         # Get recent PRs
-        prs = get_recent_prs(config)
+        prs = get_recent_prs(github_client, config, pr_data)
         
         # Show recommended actions
         show_next_actions(issues, config['monitoring']['issue_threshold_days'])
@@ -190,4 +270,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
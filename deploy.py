@@ -8,6 +8,7 @@ This script helps users set up the agent quickly by:
 3. Running a test cycle
 """
 
+import importlib.util
 import os
 import sys
 import shutil
@@ -17,21 +18,20 @@ from pathlib import Path
 def check_dependencies():
     """Check if required dependencies are installed."""
     print("Checking dependencies...")
-    
-    try:
-        import langgraph
-        import langchain
-        import github
-        import yaml
-        import jinja2
-        import schedule
-        print("✅ All dependencies are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+
+    # Probe for the packages without importing them — actually importing
+    # langgraph/langchain costs seconds of startup just to print a message
+    required = ['langgraph', 'langchain', 'github', 'yaml', 'jinja2']
+    missing = [name for name in required if importlib.util.find_spec(name) is None]
+
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("Please run: pip install -r requirements.txt")
         return False
 
+    print("✅ All dependencies are installed")
+    return True
+
 
 def setup_env_file():
     """Set up the .env file from env.example."""
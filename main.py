@@ -9,28 +9,34 @@ A LangGraph-based agent that monitors GitHub repositories for:
 Sends email notifications when conditions are met.
 """
 
+import os
 import sys
 import time
-import schedule
 from datetime import datetime
 from src import RepoMonitorWorkflow, ConfigManager
 
 
-def run_monitoring_cycle():
-    """Run a single monitoring cycle."""
+def run_monitoring_cycle(workflow=None, config_manager=None):
+    """Run a single monitoring cycle.
+
+    A workflow can be passed in to reuse its compiled graph and clients
+    across cycles; when omitted, one is built for this cycle only.
+    """
     try:
         print(f"\n{'='*60}")
         print(f"Starting monitoring cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
-        
+
         # Load configuration
-        config_manager = ConfigManager()
+        if config_manager is None:
+            config_manager = ConfigManager()
         config = config_manager.load_config()
-        
+
         # Create workflow and initial state
-        workflow = RepoMonitorWorkflow(config)
+        if workflow is None:
+            workflow = RepoMonitorWorkflow(config)
         initial_state = config_manager.create_initial_state(config)
-        
+
         # Run the workflow
         final_state = workflow.run(initial_state)
         
@@ -55,18 +61,30 @@ def run_scheduled():
     print(f"Monitoring interval: Every {interval_hours} hours")
     print(f"Email recipients: {', '.join(config['email']['recipients'])}")
     print(f"Press Ctrl+C to stop\n")
-    
-    # Schedule the monitoring cycle
-    schedule.every(interval_hours).hours.do(run_monitoring_cycle)
-    
+
+    # Build the workflow once (LangGraph compiles the graph here) and
+    # reuse it; it is only rebuilt when config.yaml changes on disk
+    workflow = RepoMonitorWorkflow(config)
+    config_mtime = os.path.getmtime(config_manager.config_path)
+
     # Run initial cycle immediately
-    run_monitoring_cycle()
-    
-    # Keep running scheduled cycles
+    run_monitoring_cycle(workflow, config_manager)
+
+    # Keep running scheduled cycles; with a single periodic job we can
+    # sleep the full interval instead of polling every minute
     while True:
         try:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            time.sleep(interval_hours * 3600)
+
+            mtime = os.path.getmtime(config_manager.config_path)
+            if mtime != config_mtime:
+                print("Configuration change detected, rebuilding workflow...")
+                config = config_manager.load_config()
+                interval_hours = config['monitoring']['check_interval_hours']
+                workflow = RepoMonitorWorkflow(config)
+                config_mtime = mtime
+
+            run_monitoring_cycle(workflow, config_manager)
         except KeyboardInterrupt:
             print("\nShutting down Repository Monitor Email Agent...")
             break
@@ -7,104 +7,193 @@ instead of direct API calls.
 """
 
 import asyncio
+import re
 import sys
 import os
 import yaml
 from datetime import datetime
 from dotenv import load_dotenv
-from src import MCPRepoMonitorWorkflow, MCPRepoMonitorState
+from src import MCPRepoMonitorWorkflow, MCPRepoMonitorState, close_mcp_client
+
+# Prefer the libyaml C loader; the pure-Python fallback parses the same
+# documents 10-20x slower
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_config_cache = None  # (mtime_ns, config) of the last parsed config.yaml
+
+# Compiled once; also handles inline references like "prefix-${VAR}-suffix"
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+def _resolve_env_var(match) -> str:
+    value = os.getenv(match.group(1))
+    if value is None:
+        raise ValueError(f"Environment variable {match.group(1)} not found")
+    return value
 
 
 def load_config() -> dict:
-    """Load configuration from YAML file with environment variable substitution."""
+    """Load configuration from YAML file with environment variable substitution.
+
+    The parsed config is cached and only re-read when config.yaml's
+    modification time changes.
+    """
+    global _config_cache
     load_dotenv()
-    
+
+    mtime_ns = os.stat('config.yaml').st_mtime_ns
+    if _config_cache is not None and _config_cache[0] == mtime_ns:
+        return _config_cache[1]
+
     with open('config.yaml', 'r') as file:
-        config = yaml.safe_load(file)
-    
+        config = yaml.load(file, Loader=_YamlLoader)
+
     # Substitute environment variables
     def substitute_env_vars(obj):
         if isinstance(obj, dict):
             return {key: substitute_env_vars(value) for key, value in obj.items()}
         elif isinstance(obj, list):
             return [substitute_env_vars(item) for item in obj]
-        elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-            env_var = obj[2:-1]
-            value = os.getenv(env_var)
-            if value is None:
-                raise ValueError(f"Environment variable {env_var} not found")
-            return value
+        elif isinstance(obj, str):
+            return _ENV_VAR_PATTERN.sub(_resolve_env_var, obj)
         else:
             return obj
     
-    return substitute_env_vars(config)
+    config = substitute_env_vars(config)
+    _config_cache = (mtime_ns, config)
+    return config
+
 
+async def run_monitoring_cycle(workflow=None, config=None):
+    """Run a single monitoring cycle using MCP.
 
-async def run_monitoring_cycle():
-    """Run a single monitoring cycle using MCP."""
+    The workflow attaches to the shared MCP client, so repeated cycles
+    reuse the same server connections regardless of whether a workflow
+    instance is passed in.
+    """
     try:
         print(f"\n{'='*60}")
         print(f"MCP Agent - Starting monitoring cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
-        
+
         # Load configuration
-        config = load_config()
-        
+        if config is None:
+            config = load_config()
+
         # Create workflow and initial state
-        workflow = MCPRepoMonitorWorkflow(config)
+        if workflow is None:
+            workflow = MCPRepoMonitorWorkflow(config)
         initial_state = MCPRepoMonitorState(
             repo_owner=config['repository']['owner'],
             repo_name=config['repository']['name'],
             issue_threshold_days=config['monitoring']['issue_threshold_days'],
             email_recipients=config['email']['recipients']
         )
-        
+
         # Run the workflow
         final_state = await workflow.run(initial_state)
-        
+
         print(f"\nMCP monitoring cycle completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Emails sent: {len(final_state.sent_notifications)}")
-        
-        # Cleanup
-        await workflow.cleanup()
-        
+
     except Exception as e:
         print(f"Error during MCP monitoring cycle: {e}")
         import traceback
         traceback.print_exc()
 
 
+async def run_webhook_server(config, workflow=None):
+    """Serve GitHub webhook events instead of polling.
+
+    Runs an aiohttp listener whose POST /webhook handler triggers a
+    monitoring cycle per event, dropping notification latency from half
+    the polling interval to seconds and cutting API polling to zero.
+    Payload signatures are verified against GITHUB_WEBHOOK_SECRET when it
+    is set.
+    """
+    import hashlib
+    import hmac
+    from aiohttp import web
+
+    secret = os.getenv('GITHUB_WEBHOOK_SECRET', '')
+    port = config['monitoring'].get('webhook_port', 8080)
+
+    async def handle_webhook(request):
+        body = await request.read()
+        if secret:
+            signature = request.headers.get('X-Hub-Signature-256', '')
+            expected = 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            if not hmac.compare_digest(signature, expected):
+                return web.Response(status=401, text='invalid signature')
+        await run_monitoring_cycle(workflow, config)
+        return web.Response(text='ok')
+
+    app = web.Application()
+    app.router.add_post('/webhook', handle_webhook)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '0.0.0.0', port)
+    await site.start()
+
+    print(f"Listening for GitHub webhooks on port {port} (POST /webhook)")
+    print(f"Press Ctrl+C to stop\n")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
 async def run_scheduled():
-    """Run the MCP agent on a schedule."""
+    """Run the MCP agent on a schedule (or webhook-driven when configured)."""
     config = load_config()
     interval_hours = config['monitoring']['check_interval_hours']
-    
-    print(f"Starting MCP Repository Monitor Email Agent")
-    print(f"Repository: {config['repository']['owner']}/{config['repository']['name']}")
-    print(f"Monitoring interval: Every {interval_hours} hours")
-    print(f"Email recipients: {', '.join(config['email']['recipients'])}")
-    print(f"Press Ctrl+C to stop\n")
-    
-    # Run initial cycle immediately
-    await run_monitoring_cycle()
-    
-    # Keep running scheduled cycles
-    while True:
-        try:
-            await asyncio.sleep(interval_hours * 3600)  # Convert hours to seconds
-            await run_monitoring_cycle()
-        except KeyboardInterrupt:
-            print("\nShutting down MCP Repository Monitor Email Agent...")
-            break
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            await asyncio.sleep(300)  # Wait 5 minutes before retrying
+
+    # Build the workflow once so the MCP server connections (stdio
+    # subprocess spawn + handshake) are reused across cycles
+    workflow = MCPRepoMonitorWorkflow(config)
+    try:
+        # Event-driven mode: no polling at all when webhooks are configured
+        if config['monitoring'].get('mode') == 'webhook':
+            try:
+                await run_webhook_server(config, workflow)
+                return
+            except ImportError:
+                print("⚠️  aiohttp not installed, falling back to polling")
+
+        print(f"Starting MCP Repository Monitor Email Agent")
+        print(f"Repository: {config['repository']['owner']}/{config['repository']['name']}")
+        print(f"Monitoring interval: Every {interval_hours} hours")
+        print(f"Email recipients: {', '.join(config['email']['recipients'])}")
+        print(f"Press Ctrl+C to stop\n")
+
+        # Run initial cycle immediately
+        await run_monitoring_cycle(workflow, config)
+
+        # Keep running scheduled cycles
+        while True:
+            try:
+                await asyncio.sleep(interval_hours * 3600)  # Convert hours to seconds
+                await run_monitoring_cycle(workflow, config)
+            except KeyboardInterrupt:
+                print("\nShutting down MCP Repository Monitor Email Agent...")
+                break
+            except Exception as e:
+                print(f"Unexpected error: {e}")
+                await asyncio.sleep(300)  # Wait 5 minutes before retrying
+    finally:
+        await close_mcp_client()
 
 
 async def run_once():
     """Run the MCP agent once."""
     print("Running MCP Repository Monitor Email Agent (single run)")
-    await run_monitoring_cycle()
+    try:
+        await run_monitoring_cycle()
+    finally:
+        await close_mcp_client()
 
 
 async def main():
@@ -1,5 +1,5 @@
 from .state import MCPRepoMonitorState, MCPIssueModel, MCPPullRequestModel
-from .mcp_client import MCPClient
+from .mcp_client import MCPClient, get_mcp_client, close_mcp_client
 from .workflow import MCPRepoMonitorWorkflow
 
 __all__ = [
@@ -7,5 +7,7 @@ __all__ = [
     'MCPIssueModel',
     'MCPPullRequestModel',
     'MCPClient',
+    'get_mcp_client',
+    'close_mcp_client',
     'MCPRepoMonitorWorkflow'
-] 
\ No newline at end of file
+]
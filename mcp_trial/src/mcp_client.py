@@ -13,8 +13,15 @@ from dataclasses import dataclass
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# ciso8601 is a C extension that parses ISO-8601 strings much faster than
+# datetime.fromisoformat; fall back to the stdlib when it isn't installed
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
 
-@dataclass
+
+@dataclass(slots=True)
 class MCPIssue:
     """GitHub issue model for MCP."""
     number: int
@@ -25,14 +32,12 @@ class MCPIssue:
     html_url: str
     labels: List[Dict] = None
     assignees: List[Dict] = None
-    
-    @property
-    def age_days(self) -> int:
-        """Calculate how many days the issue has been open."""
-        return (datetime.now() - self.created_at).days
+    # How many days the issue has been open, computed once at fetch time
+    # instead of on every access
+    age_days: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPPullRequest:
     """GitHub pull request model for MCP."""
     number: int
@@ -43,11 +48,8 @@ class MCPPullRequest:
     html_url: str
     labels: List[Dict] = None
     assignees: List[Dict] = None
-    
-    @property
-    def is_merged(self) -> bool:
-        """Check if the PR was merged."""
-        return self.merged_at is not None
+    # Whether the PR was merged, derived once from merged_at at fetch time
+    is_merged: bool = False
 
 
 class MCPClient:
@@ -57,11 +59,17 @@ class MCPClient:
         self.config = config
         self.github_session: Optional[ClientSession] = None
         self.email_session: Optional[ClientSession] = None
+        # Whether the email server exposes email_send_batch; probed once
+        # on the first batch send
+        self._batch_tool_available: Optional[bool] = None
         
     async def connect(self):
-        """Connect to MCP servers."""
-        await self._connect_github()
-        await self._connect_email()
+        """Connect to MCP servers.
+
+        The two connects each spawn a stdio subprocess and perform the MCP
+        handshake independently, so they run concurrently.
+        """
+        await asyncio.gather(self._connect_github(), self._connect_email())
     
     async def _connect_github(self):
         """Connect to GitHub MCP server."""
@@ -112,16 +120,19 @@ class MCPClient:
             )
             
             issues = []
+            now = datetime.now()
             for issue_data in result.content:
+                created_at = _parse_datetime(issue_data['created_at'])
                 issue = MCPIssue(
                     number=issue_data['number'],
                     title=issue_data['title'],
                     state=issue_data['state'],
-                    created_at=datetime.fromisoformat(issue_data['created_at']),
-                    updated_at=datetime.fromisoformat(issue_data['updated_at']),
+                    created_at=created_at,
+                    updated_at=_parse_datetime(issue_data['updated_at']),
                     html_url=issue_data['html_url'],
                     labels=issue_data.get('labels', []),
-                    assignees=issue_data.get('assignees', [])
+                    assignees=issue_data.get('assignees', []),
+                    age_days=(now - created_at).days
                 )
                 issues.append(issue)
             
@@ -150,15 +161,17 @@ class MCPClient:
             
             prs = []
             for pr_data in result.content:
+                merged_at = _parse_datetime(pr_data['merged_at']) if pr_data.get('merged_at') else None
                 pr = MCPPullRequest(
                     number=pr_data['number'],
                     title=pr_data['title'],
                     state=pr_data['state'],
-                    merged_at=datetime.fromisoformat(pr_data['merged_at']) if pr_data.get('merged_at') else None,
-                    closed_at=datetime.fromisoformat(pr_data['closed_at']) if pr_data.get('closed_at') else None,
+                    merged_at=merged_at,
+                    closed_at=_parse_datetime(pr_data['closed_at']) if pr_data.get('closed_at') else None,
                     html_url=pr_data['html_url'],
                     labels=pr_data.get('labels', []),
-                    assignees=pr_data.get('assignees', [])
+                    assignees=pr_data.get('assignees', []),
+                    is_merged=merged_at is not None
                 )
                 prs.append(pr)
             
@@ -205,20 +218,98 @@ class MCPClient:
             )
             
             return result.content.get('success', False)
-            
+
         except Exception as e:
             print(f"❌ Failed to send email via MCP: {e}")
             return False
-    
+
+    async def send_emails(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        """Send several emails in one MCP tool call.
+
+        Each message is a dict with 'to', 'subject', 'body' and optional
+        'html_body'. Falls back to concurrent single sends when the
+        server does not expose a batch tool.
+        """
+        if not self.email_session:
+            raise RuntimeError("Email MCP session not connected")
+
+        # Fall back to single sends only when the batch tool is genuinely
+        # absent — retrying after an arbitrary call_tool failure could
+        # re-deliver a batch the server already accepted
+        if self._batch_tool_available is None:
+            try:
+                tools = await self.email_session.list_tools()
+                self._batch_tool_available = any(
+                    tool.name == "email_send_batch" for tool in tools.tools
+                )
+            except Exception:
+                self._batch_tool_available = False
+
+        if not self._batch_tool_available:
+            # Server lacks batch support; overlap the single sends instead
+            return list(await asyncio.gather(*(
+                self.send_email(
+                    message['to'],
+                    message['subject'],
+                    message['body'],
+                    message.get('html_body')
+                )
+                for message in messages
+            )))
+
+        try:
+            result = await self.email_session.call_tool(
+                "email_send_batch",
+                {"messages": messages}
+            )
+        except Exception as e:
+            print(f"❌ Failed to send email batch via MCP: {e}")
+            return [False] * len(messages)
+
+        # The server replies either with the dict convention email_send
+        # uses ({'results': [...]}) or a bare list of per-message results
+        content = result.content
+        items = content.get('results', []) if isinstance(content, dict) else content
+        return [
+            item.get('success', False) if isinstance(item, dict) else bool(item)
+            for item in items
+        ]
+
     async def close(self):
-        """Close MCP sessions."""
+        """Close MCP sessions concurrently."""
+        closers = []
         if self.github_session:
-            await self.github_session.aclose()
+            closers.append(self.github_session.aclose())
         if self.email_session:
-            await self.email_session.aclose()
+            closers.append(self.email_session.aclose())
+        if closers:
+            await asyncio.gather(*closers)
         print("✅ Closed MCP sessions")
 
 
+# Shared client so repeated workflow runs reuse the MCP server
+# connections instead of paying the stdio spawn + handshake per cycle
+_client: Optional[MCPClient] = None
+
+
+async def get_mcp_client(config: Dict[str, Any]) -> MCPClient:
+    """Return the shared MCP client, connecting it on first use."""
+    global _client
+    if _client is None:
+        client = MCPClient(config)
+        await client.connect()
+        _client = client
+    return _client
+
+
+async def close_mcp_client():
+    """Close the shared MCP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
 # Convenience functions for synchronous usage
 def create_mcp_client(config: Dict[str, Any]) -> MCPClient:
     """Create and connect MCP client."""
@@ -7,35 +7,39 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 
+from .mcp_client import MCPIssue, MCPPullRequest
 
-@dataclass
+
+@dataclass(slots=True)
 class MCPRepoMonitorState:
     """State for the MCP-based repository monitoring workflow."""
-    
+
     # Repository configuration
     repo_owner: str
     repo_name: str
-    
+
     # Monitoring configuration
     issue_threshold_days: int = 7
     email_recipients: List[str] = field(default_factory=list)
-    
-    # Current repository state
-    open_issues: List[Dict] = field(default_factory=list)
-    recent_prs: List[Dict] = field(default_factory=list)
-    
+
+    # Current repository state (typed client objects, constructed once at
+    # fetch time and shared by the analyzers and email builders)
+    open_issues: List[MCPIssue] = field(default_factory=list)
+    recent_prs: List[MCPPullRequest] = field(default_factory=list)
+
     # Email tracking
     last_email_sent: Optional[datetime] = None
     sent_notifications: List[str] = field(default_factory=list)
-    
+
     # Workflow state
     should_send_issue_alert: bool = False
     should_send_pr_notification: bool = False
-    alert_issues: List[Dict] = field(default_factory=list)
-    notification_prs: List[Dict] = field(default_factory=list)
-    
-    # MCP client reference
-    mcp_client: Optional[object] = None
+    alert_issues: List[MCPIssue] = field(default_factory=list)
+    notification_prs: List[MCPPullRequest] = field(default_factory=list)
+
+    # Wall-clock time captured once at the start of each run and reused
+    # by every node that needs "now"
+    run_started_at: Optional[datetime] = None
 
 
 class MCPIssueModel(BaseModel):
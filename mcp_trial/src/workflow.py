@@ -3,114 +3,116 @@ MCP-based LangGraph workflow for repository monitoring
 """
 
 import asyncio
+import time
 from typing import Dict, Any
-from langgraph.graph import StateGraph, END
-from .state import MCPRepoMonitorState, MCPIssueModel, MCPPullRequestModel
-from .mcp_client import MCPClient
+from .state import MCPRepoMonitorState
+from .mcp_client import get_mcp_client
 from datetime import datetime
 
+# numpy is optional here; the analyzer falls back to a plain loop
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# How long fetched issue/PR lists stay fresh; webhook-triggered cycles
+# can fire in bursts, and refetching within this window just burns
+# GitHub rate limit on identical data
+_FETCH_CACHE_TTL_SECONDS = 300
+
 
 class MCPRepoMonitorWorkflow:
-    """LangGraph workflow for MCP-based repository monitoring."""
-    
+    """Workflow for MCP-based repository monitoring.
+
+    The dataflow is a short pipeline — fetch, analyze, maybe send, update
+    — so run() simply awaits the node methods in order rather than paying
+    LangGraph's graph compile and per-run state bookkeeping for a
+    workflow with no real branching.
+    """
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.mcp_client = None
-        
-        # Create the workflow graph
-        self.workflow = self._create_workflow()
-    
+        self._fetch_cache = {}  # (owner, name, lookback_hours) -> (monotonic_ts, issues, prs)
+
     async def initialize(self):
-        """Initialize MCP client."""
-        self.mcp_client = MCPClient(self.config)
-        await self.mcp_client.connect()
-    
-    def _create_workflow(self) -> StateGraph:
-        """Create the LangGraph workflow."""
-        
-        # Create the state graph
-        workflow = StateGraph(MCPRepoMonitorState)
-        
-        # Add nodes
-        workflow.add_node("fetch_data", self._fetch_data_node)
-        workflow.add_node("analyze_issues", self._analyze_issues_node)
-        workflow.add_node("analyze_prs", self._analyze_prs_node)
-        workflow.add_node("send_issue_alert", self._send_issue_alert_node)
-        workflow.add_node("send_pr_notification", self._send_pr_notification_node)
-        workflow.add_node("update_state", self._update_state_node)
-        
-        # Define the workflow edges
-        workflow.set_entry_point("fetch_data")
-        
-        # After fetching data, analyze both issues and PRs
-        workflow.add_edge("fetch_data", "analyze_issues")
-        workflow.add_edge("fetch_data", "analyze_prs")
-        
-        # Conditional edges based on analysis results
-        workflow.add_conditional_edges(
-            "analyze_issues",
-            self._should_send_issue_alert,
-            {
-                "send_alert": "send_issue_alert",
-                "skip": "update_state"
-            }
-        )
-        
-        workflow.add_conditional_edges(
-            "analyze_prs",
-            self._should_send_pr_notification,
-            {
-                "send_notification": "send_pr_notification",
-                "skip": "update_state"
-            }
-        )
-        
-        # After sending emails, update state
-        workflow.add_edge("send_issue_alert", "update_state")
-        workflow.add_edge("send_pr_notification", "update_state")
-        
-        # End the workflow
-        workflow.add_edge("update_state", END)
-        
-        return workflow.compile()
-    
+        """Attach the shared MCP client, connecting it on first use."""
+        self.mcp_client = await get_mcp_client(self.config)
+
     async def _fetch_data_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
         """Fetch current repository data using MCP."""
         print(f"Fetching data for {state.repo_owner}/{state.repo_name} via MCP...")
-        
+
         if not self.mcp_client:
             raise RuntimeError("MCP client not initialized")
-        
-        # Fetch open issues via MCP
-        issues = await self.mcp_client.get_open_issues(state.repo_owner, state.repo_name)
-        state.open_issues = [issue.__dict__ for issue in issues]
-        
-        # Fetch recent PRs via MCP
-        prs = await self.mcp_client.get_recent_prs(
-            state.repo_owner, 
-            state.repo_name, 
-            self.config['monitoring']['pr_lookback_hours']
-        )
-        state.recent_prs = [pr.__dict__ for pr in prs]
+
+        # One clock read per run; downstream nodes reuse this timestamp
+        state.run_started_at = datetime.now()
+
+        lookback_hours = self.config['monitoring']['pr_lookback_hours']
+        cache_key = (state.repo_owner, state.repo_name, lookback_hours)
+        cached = self._fetch_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _FETCH_CACHE_TTL_SECONDS:
+            _, issues, prs = cached
+            print("Using cached repository data (fetched within the last "
+                  f"{_FETCH_CACHE_TTL_SECONDS}s)")
+        else:
+            # Fetch open issues and recent PRs concurrently — the two MCP
+            # round trips are independent, so the node waits on the slower
+            # one rather than their sum (each call already catches its own
+            # failures and returns an empty list)
+            issues, prs = await asyncio.gather(
+                self.mcp_client.get_open_issues(state.repo_owner, state.repo_name),
+                self.mcp_client.get_recent_prs(
+                    state.repo_owner,
+                    state.repo_name,
+                    lookback_hours
+                )
+            )
+            self._fetch_cache[cache_key] = (time.monotonic(), issues, prs)
+        # Keep the typed client objects; converting to dicts here only to
+        # re-hydrate models in every downstream node parses each item
+        # several times per cycle
+        state.open_issues = issues
+        state.recent_prs = prs
         
         print(f"Found {len(state.open_issues)} open issues and {len(state.recent_prs)} recent PRs via MCP")
         return state
     
+    async def _analyze_data_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
+        """Run the issue and PR analyses concurrently.
+
+        The two analyses touch disjoint state fields, so there is no reason
+        to serialize them through separate graph branches.
+        """
+        await asyncio.gather(
+            asyncio.to_thread(self._analyze_issues_node, state),
+            asyncio.to_thread(self._analyze_prs_node, state)
+        )
+        return state
+
     def _analyze_issues_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
         """Analyze issues to determine if alerts should be sent."""
         print("Analyzing issues for alerts...")
         
-        # Find issues that exceed the threshold
-        alert_issues = []
-        for issue_data in state.open_issues:
-            issue = MCPIssueModel(**issue_data)
-            if issue.age_days >= state.issue_threshold_days:
-                alert_issues.append(issue_data)
-        
-        state.alert_issues = alert_issues
-        state.should_send_issue_alert = len(alert_issues) > 0
-        
-        print(f"Found {len(alert_issues)} issues that exceed the {state.issue_threshold_days}-day threshold")
+        # Find issues that exceed the threshold. On large repos the
+        # comparison runs as one vectorized numpy op over the precomputed
+        # ages; below 64 issues the array setup outweighs the win
+        issues = state.open_issues
+        if np is not None and len(issues) >= 64:
+            ages = np.fromiter((issue.age_days for issue in issues),
+                               dtype=np.int64, count=len(issues))
+            state.alert_issues = [
+                issues[i] for i in np.flatnonzero(ages >= state.issue_threshold_days)
+            ]
+        else:
+            state.alert_issues = [
+                issue for issue in issues
+                if issue.age_days >= state.issue_threshold_days
+            ]
+        state.should_send_issue_alert = bool(state.alert_issues)
+
+        print(f"Found {len(state.alert_issues)} issues that exceed the {state.issue_threshold_days}-day threshold")
         return state
     
     def _analyze_prs_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
@@ -118,117 +120,100 @@ class MCPRepoMonitorWorkflow:
         print("Analyzing PRs for notifications...")
         
         # Find PRs that were recently merged or closed
-        notification_prs = []
-        for pr_data in state.recent_prs:
-            pr = MCPPullRequestModel(**pr_data)
-            if pr.is_merged or pr.closed_at:
-                notification_prs.append(pr_data)
-        
-        state.notification_prs = notification_prs
-        state.should_send_pr_notification = len(notification_prs) > 0
-        
-        print(f"Found {len(notification_prs)} PRs that were recently processed")
+        state.notification_prs = [
+            pr for pr in state.recent_prs
+            if pr.is_merged or pr.closed_at
+        ]
+        state.should_send_pr_notification = bool(state.notification_prs)
+
+        print(f"Found {len(state.notification_prs)} PRs that were recently processed")
         return state
     
-    def _should_send_issue_alert(self, state: MCPRepoMonitorState) -> str:
-        """Determine if issue alert should be sent."""
-        return "send_alert" if state.should_send_issue_alert else "skip"
-    
-    def _should_send_pr_notification(self, state: MCPRepoMonitorState) -> str:
-        """Determine if PR notification should be sent."""
-        return "send_notification" if state.should_send_pr_notification else "skip"
-    
-    async def _send_issue_alert_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
-        """Send issue alert email via MCP."""
-        print("Sending issue alert email via MCP...")
-        
-        if not self.mcp_client:
-            raise RuntimeError("MCP client not initialized")
-        
-        # Create email content
+    def _route_notifications(self, state: MCPRepoMonitorState) -> str:
+        """Route to the notification node when any alert is pending."""
+        if state.should_send_issue_alert or state.should_send_pr_notification:
+            return "send_notifications"
+        return "skip"
+
+    def _build_issue_alert_email(self, state: MCPRepoMonitorState) -> tuple:
+        """Build the subject and text body for the issue alert email."""
         subject = f"[ALERT] Issues Open Beyond {state.issue_threshold_days} Days - {state.repo_name}"
-        
-        # Simple text body for MCP
-        body_lines = [f"Repository: {state.repo_owner}/{state.repo_name}"]
-        body_lines.append(f"Threshold: {state.issue_threshold_days} days")
-        body_lines.append("")
-        
-        for issue_data in state.alert_issues:
-            issue = MCPIssueModel(**issue_data)
-            body_lines.append(f"#{issue.number}: {issue.title}")
-            body_lines.append(f"  Age: {issue.age_days} days")
-            body_lines.append(f"  URL: {issue.html_url}")
-            body_lines.append("")
-        
-        body = "\n".join(body_lines)
-        
-        # Send email via MCP
-        success = await self.mcp_client.send_email(
-            recipients=state.email_recipients,
-            subject=subject,
-            body=body
+
+        # Simple text body for MCP: one f-string per issue, joined once
+        header = (
+            f"Repository: {state.repo_owner}/{state.repo_name}\n"
+            f"Threshold: {state.issue_threshold_days} days\n"
         )
-        
-        if success:
-            print("Issue alert email sent successfully via MCP")
-            state.sent_notifications.append(f"issue_alert_{datetime.now().isoformat()}")
-        else:
-            print("Failed to send issue alert email via MCP")
-        
-        return state
-    
-    async def _send_pr_notification_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
-        """Send PR notification email via MCP."""
-        print("Sending PR notification email via MCP...")
-        
+        body = "\n".join([header, *(
+            f"#{issue.number}: {issue.title}\n"
+            f"  Age: {issue.age_days} days\n"
+            f"  URL: {issue.html_url}\n"
+            for issue in state.alert_issues
+        )])
+
+        return subject, body
+
+    def _build_pr_notification_email(self, state: MCPRepoMonitorState) -> tuple:
+        """Build the subject and text body for the PR notification email."""
+        subject = f"[UPDATE] Pull Requests Processed - {state.repo_name}"
+
+        # Simple text body for MCP: one f-string per PR, joined once
+        header = f"Repository: {state.repo_owner}/{state.repo_name}\n"
+        body = "\n".join([header, *(
+            f"#{pr.number}: {pr.title}\n"
+            f"  Status: {'merged' if pr.is_merged else 'closed'}\n"
+            f"  URL: {pr.html_url}\n"
+            for pr in state.notification_prs
+        )])
+
+        return subject, body
+
+    async def _send_notifications_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
+        """Send the pending alert emails, overlapping the MCP round trips."""
+        print("Sending notification emails via MCP...")
+
         if not self.mcp_client:
             raise RuntimeError("MCP client not initialized")
-        
-        # Create email content
-        subject = f"[UPDATE] Pull Requests Processed - {state.repo_name}"
-        
-        # Simple text body for MCP
-        body_lines = [f"Repository: {state.repo_owner}/{state.repo_name}"]
-        body_lines.append("")
-        
-        for pr_data in state.notification_prs:
-            pr = MCPPullRequestModel(**pr_data)
-            status = "merged" if pr.is_merged else "closed"
-            body_lines.append(f"#{pr.number}: {pr.title}")
-            body_lines.append(f"  Status: {status}")
-            body_lines.append(f"  URL: {pr.html_url}")
-            body_lines.append("")
-        
-        body = "\n".join(body_lines)
-        
-        # Send email via MCP
-        success = await self.mcp_client.send_email(
-            recipients=state.email_recipients,
-            subject=subject,
-            body=body
-        )
-        
-        if success:
-            print("PR notification email sent successfully via MCP")
-            state.sent_notifications.append(f"pr_notification_{datetime.now().isoformat()}")
-        else:
-            print("Failed to send PR notification email via MCP")
-        
+
+        # Build the pending envelopes, then ship them in one batch call so
+        # a single MCP round trip carries both emails
+        pending = []
+        if state.should_send_issue_alert:
+            pending.append(("issue_alert", self._build_issue_alert_email(state)))
+        if state.should_send_pr_notification:
+            pending.append(("pr_notification", self._build_pr_notification_email(state)))
+
+        results = await self.mcp_client.send_emails([
+            {
+                "to": state.email_recipients,
+                "subject": subject,
+                "body": body
+            }
+            for _, (subject, body) in pending
+        ])
+
+        for (tag, _), success in zip(pending, results):
+            if success:
+                print(f"{tag} email sent successfully via MCP")
+                state.sent_notifications.append(f"{tag}_{state.run_started_at.isoformat()}")
+            else:
+                print(f"Failed to send {tag} email via MCP")
+
         return state
-    
+
     def _update_state_node(self, state: MCPRepoMonitorState) -> MCPRepoMonitorState:
         """Update workflow state after processing."""
         print("Updating workflow state...")
         
         # Update last email sent time if any emails were sent
         if state.sent_notifications:
-            state.last_email_sent = datetime.now()
+            state.last_email_sent = state.run_started_at
         
-        # Reset workflow flags
+        # Reset workflow flags; clear() reuses the existing list storage
         state.should_send_issue_alert = False
         state.should_send_pr_notification = False
-        state.alert_issues = []
-        state.notification_prs = []
+        state.alert_issues.clear()
+        state.notification_prs.clear()
         
         print("MCP workflow completed successfully")
         return state
@@ -239,15 +224,19 @@ class MCPRepoMonitorWorkflow:
         if not self.mcp_client:
             await self.initialize()
         
-        # Set MCP client in state
-        initial_state.mcp_client = self.mcp_client
-        
-        # Run the workflow
-        final_state = self.workflow.invoke(initial_state)
-        
-        return final_state
+        # Run the pipeline directly; nodes reach the MCP client through
+        # self, keeping the state plain data that can be serialized
+
+        state = await self._fetch_data_node(initial_state)
+        state = await self._analyze_data_node(state)
+        if self._route_notifications(state) == "send_notifications":
+            state = await self._send_notifications_node(state)
+        return self._update_state_node(state)
     
     async def cleanup(self):
-        """Clean up MCP connections."""
-        if self.mcp_client:
-            await self.mcp_client.close() 
\ No newline at end of file
+        """Release the shared MCP client reference.
+
+        The connections themselves belong to the module-level client and
+        are closed once at process exit via close_mcp_client().
+        """
+        self.mcp_client = None
@@ -133,15 +133,15 @@ def test_config_loading():
     print("Testing MCP configuration loading...")
     
     try:
-        import yaml
-        
+        from main import load_config
+
         if not os.path.exists('config.yaml'):
             print("❌ config.yaml not found")
             return False
-        
-        with open('config.yaml', 'r') as file:
-            config = yaml.safe_load(file)
-        
+
+        # Shares the mtime-cached loader, so repeat runs skip the parse
+        config = load_config()
+
         print(f"✅ MCP configuration loaded successfully")
         print(f"   Repository: {config['repository']['owner']}/{config['repository']['name']}")
         print(f"   Issue threshold: {config['monitoring']['issue_threshold_days']} days")
@@ -33,13 +33,6 @@ def test_basic_imports():
         print("❌ Jinja2 not available")
         return False
     
-    try:
-        import schedule
-        print("✅ Schedule imported successfully")
-    except ImportError:
-        print("❌ Schedule not available")
-        return False
-    
     try:
         from dotenv import load_dotenv
         print("✅ python-dotenv imported successfully")
@@ -101,15 +94,15 @@ def test_config_loading():
     print("\nTesting configuration loading...")
     
     try:
-        import yaml
-        
+        from src.config_manager import ConfigManager
+
         if not os.path.exists('config.yaml'):
             print("❌ config.yaml not found")
             return False
-        
-        with open('config.yaml', 'r') as file:
-            config = yaml.safe_load(file)
-        
+
+        # Shares the mtime-cached loader, so repeat runs skip the parse
+        config = ConfigManager('config.yaml').load_config()
+
         print(f"✅ Configuration loaded successfully")
         print(f"   Repository: {config['repository']['owner']}/{config['repository']['name']}")
         print(f"   Issue threshold: {config['monitoring']['issue_threshold_days']} days")
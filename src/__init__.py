@@ -1,15 +1,34 @@
-from .state import RepoMonitorState, Issue, PullRequest
-from .github_client import GitHubClient
-from .email_service import EmailService
-from .workflow import RepoMonitorWorkflow
-from .config_manager import ConfigManager
+# State models are lightweight; import them eagerly. The heavy modules
+# (LangGraph, PyGithub, Jinja2) are resolved lazily via PEP 562 so that
+# scripts needing only ConfigManager or the state models don't pay their
+# import cost.
+from .state import RepoMonitorState, Issue, PullRequest, IssueTable
 
 __all__ = [
     'RepoMonitorState',
-    'Issue', 
+    'Issue',
     'PullRequest',
+    'IssueTable',
     'GitHubClient',
     'EmailService',
     'RepoMonitorWorkflow',
     'ConfigManager'
-] 
\ No newline at end of file
+]
+
+_LAZY_IMPORTS = {
+    'GitHubClient': 'github_client',
+    'EmailService': 'email_service',
+    'RepoMonitorWorkflow': 'workflow',
+    'ConfigManager': 'config_manager',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    module = import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
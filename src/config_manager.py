@@ -1,76 +1,105 @@
 import os
+import re
 import yaml
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+# Prefer the libyaml C loader; the pure-Python fallback parses the same
+# documents 10-20x slower
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Compiled once; also handles inline references like "prefix-${VAR}-suffix"
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Required configuration fields, hoisted so validation doesn't rebuild
+# the lists on every call
+_REQUIRED_SECTIONS = frozenset({'repository', 'monitoring', 'email'})
+_REQUIRED_REPO_FIELDS = frozenset({'owner', 'name', 'token'})
+_REQUIRED_MONITORING_FIELDS = frozenset({'issue_threshold_days', 'check_interval_hours', 'pr_lookback_hours'})
+_REQUIRED_EMAIL_FIELDS = frozenset({'smtp_host', 'smtp_port', 'username', 'password', 'recipients'})
+
+
+def _resolve_env_var(match: 're.Match') -> str:
+    value = os.getenv(match.group(1))
+    if value is None:
+        raise ValueError(f"Environment variable {match.group(1)} not found")
+    return value
+
 
 class ConfigManager:
     """Manages configuration loading and environment variable substitution."""
     
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
+        self._cached_config = None  # (mtime_ns, config) of the last successful load
         load_dotenv()  # Load environment variables from .env file
-    
+
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file with environment variable substitution."""
+        """Load configuration from YAML file with environment variable substitution.
+
+        The parsed configuration is cached and only re-read when the file's
+        modification time changes, so repeated calls are effectively free.
+        """
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        
+
+        # Reuse the cached config unless the file changed on disk
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        if self._cached_config is not None and self._cached_config[0] == mtime_ns:
+            return self._cached_config[1]
+
         with open(self.config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        
-        # Substitute environment variables
+            config = yaml.load(file, Loader=_YamlLoader)
+
+        # Substitute environment variables per string leaf after parsing;
+        # substituting into the raw text would let secret values containing
+        # quotes or backslashes corrupt the YAML they land in
         config = self._substitute_env_vars(config)
-        
+
         # Validate configuration
         self._validate_config(config)
-        
+
+        self._cached_config = (mtime_ns, config)
         return config
-    
+
     def _substitute_env_vars(self, obj: Any) -> Any:
-        """Recursively substitute environment variables in configuration values."""
+        """Recursively substitute ${VAR} references in string values."""
         if isinstance(obj, dict):
             return {key: self._substitute_env_vars(value) for key, value in obj.items()}
         elif isinstance(obj, list):
             return [self._substitute_env_vars(item) for item in obj]
-        elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-            env_var = obj[2:-1]  # Remove ${ and }
-            value = os.getenv(env_var)
-            if value is None:
-                raise ValueError(f"Environment variable {env_var} not found")
-            return value
+        elif isinstance(obj, str):
+            return _ENV_VAR_PATTERN.sub(_resolve_env_var, obj)
         else:
             return obj
-    
+
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """Validate the configuration structure and required fields."""
-        required_sections = ['repository', 'monitoring', 'email']
-        
-        for section in required_sections:
-            if section not in config:
-                raise ValueError(f"Missing required configuration section: {section}")
-        
-        # Validate repository section
+        missing = _REQUIRED_SECTIONS - config.keys()
+        if missing:
+            raise ValueError(f"Missing required configuration sections: {', '.join(sorted(missing))}")
+
+        # Validate each section with a single set difference, reporting
+        # every missing field at once
         repo_config = config['repository']
-        required_repo_fields = ['owner', 'name', 'token']
-        for field in required_repo_fields:
-            if field not in repo_config:
-                raise ValueError(f"Missing required repository field: {field}")
-        
-        # Validate monitoring section
+        missing = _REQUIRED_REPO_FIELDS - repo_config.keys()
+        if missing:
+            raise ValueError(f"Missing required repository fields: {', '.join(sorted(missing))}")
+
         monitoring_config = config['monitoring']
-        required_monitoring_fields = ['issue_threshold_days', 'check_interval_hours', 'pr_lookback_hours']
-        for field in required_monitoring_fields:
-            if field not in monitoring_config:
-                raise ValueError(f"Missing required monitoring field: {field}")
-        
-        # Validate email section
+        missing = _REQUIRED_MONITORING_FIELDS - monitoring_config.keys()
+        if missing:
+            raise ValueError(f"Missing required monitoring fields: {', '.join(sorted(missing))}")
+
         email_config = config['email']
-        required_email_fields = ['smtp_host', 'smtp_port', 'username', 'password', 'recipients']
-        for field in required_email_fields:
-            if field not in email_config:
-                raise ValueError(f"Missing required email field: {field}")
-        
+        missing = _REQUIRED_EMAIL_FIELDS - email_config.keys()
+        if missing:
+            raise ValueError(f"Missing required email fields: {', '.join(sorted(missing))}")
+
+
         # Validate data types
         if not isinstance(monitoring_config['issue_threshold_days'], int):
             raise ValueError("issue_threshold_days must be an integer")
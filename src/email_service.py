@@ -1,47 +1,17 @@
+import html
+import io
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.mime.nonmultipart import MIMENonMultipart
 from datetime import datetime
 from typing import List, Dict
 from jinja2 import Template
 
-
-class EmailService:
-    """Service for sending email notifications."""
-    
-    def __init__(self, smtp_host: str, smtp_port: int, username: str, password: str):
-        self.smtp_host = smtp_host
-        self.smtp_port = smtp_port
-        self.username = username
-        self.password = password
-    
-    def send_issue_alert(self, recipients: List[str], issues: List[Dict], 
-                        repo_name: str, repo_url: str, threshold_days: int) -> bool:
-        """Send email alert for issues that have been open beyond the threshold."""
-        
-        subject = f"[ALERT] Issues Open Beyond {threshold_days} Days - {repo_name}"
-        
-        # Create email content
-        content = self._create_issue_alert_content(issues, repo_name, repo_url, threshold_days)
-        
-        return self._send_email(recipients, subject, content)
-    
-    def send_pr_notification(self, recipients: List[str], prs: List[Dict], 
-                           repo_name: str, repo_url: str) -> bool:
-        """Send email notification for recently merged pull requests."""
-        
-        subject = f"[UPDATE] Pull Requests Merged - {repo_name}"
-        
-        # Create email content
-        content = self._create_pr_notification_content(prs, repo_name, repo_url)
-        
-        return self._send_email(recipients, subject, content)
-    
-    def _create_issue_alert_content(self, issues: List[Dict], repo_name: str, 
-                                  repo_url: str, threshold_days: int) -> str:
-        """Create HTML content for issue alert email."""
-        
-        template = Template("""
+# Compiled once at import time; Template() lexes, parses and compiles the
+# HTML on every call, which is pure waste for static template strings
+_ISSUE_ALERT_TEMPLATE = Template("""
         <html>
         <head>
             <style>
@@ -52,6 +22,7 @@ class EmailService:
                 .issue-meta { color: #666; font-size: 14px; margin-top: 5px; }
                 .issue-link { color: #0366d6; text-decoration: none; }
                 .repo-link { margin-top: 20px; }
+                .label { color: white; padding: 2px 6px; border-radius: 3px; font-size: 12px; }
             </style>
         </head>
         <body>
@@ -59,38 +30,15 @@ class EmailService:
                 <h2>🚨 Issues Open Beyond {{ threshold_days }} Days</h2>
                 <p>Repository: {{ repo_name }}</p>
             </div>
-            
+
             <p>The following issues have been open for more than <strong>{{ threshold_days }} days</strong> and may require attention:</p>
-            
-            {% for issue in issues %}
-            <div class="issue">
-                <div class="issue-title">
-                    <a href="{{ issue.html_url }}" class="issue-link">#{{ issue.number }} - {{ issue.title }}</a>
-                </div>
-                <div class="issue-meta">
-                    <strong>Age:</strong> {{ issue.age_days }} days<br>
-                    <strong>Created:</strong> {{ issue.created_at.strftime('%Y-%m-%d %H:%M') }}<br>
-                    <strong>Last Updated:</strong> {{ issue.updated_at.strftime('%Y-%m-%d %H:%M') }}<br>
-                    {% if issue.labels %}
-                    <strong>Labels:</strong> 
-                    {% for label in issue.labels %}
-                    <span style="background-color: #{{ label.color }}; color: white; padding: 2px 6px; border-radius: 3px; font-size: 12px;">{{ label.name }}</span>
-                    {% endfor %}<br>
-                    {% endif %}
-                    {% if issue.assignees %}
-                    <strong>Assignees:</strong> 
-                    {% for assignee in issue.assignees %}
-                    {{ assignee.login }}{% if not loop.last %}, {% endif %}
-                    {% endfor %}
-                    {% endif %}
-                </div>
-            </div>
-            {% endfor %}
-            
+
+            {{ issue_blocks }}
+
             <div class="repo-link">
                 <a href="{{ repo_url }}" class="issue-link">View Repository on GitHub</a>
             </div>
-            
+
             <hr>
             <p style="color: #666; font-size: 12px;">
                 This email was sent by the Repository Monitor Agent on {{ datetime.now().strftime('%Y-%m-%d %H:%M:%S') }}
@@ -98,19 +46,8 @@ class EmailService:
         </body>
         </html>
         """)
-        
-        return template.render(
-            issues=issues,
-            repo_name=repo_name,
-            repo_url=repo_url,
-            threshold_days=threshold_days,
-            datetime=datetime
-        )
-    
-    def _create_pr_notification_content(self, prs: List[Dict], repo_name: str, repo_url: str) -> str:
-        """Create HTML content for PR notification email."""
-        
-        template = Template("""
+
+_PR_NOTIFICATION_TEMPLATE = Template("""
         <html>
         <head>
             <style>
@@ -121,6 +58,7 @@ class EmailService:
                 .pr-meta { color: #666; font-size: 14px; margin-top: 5px; }
                 .pr-link { color: #0366d6; text-decoration: none; }
                 .repo-link { margin-top: 20px; }
+                .label { color: white; padding: 2px 6px; border-radius: 3px; font-size: 12px; }
                 .merged { border-left: 4px solid #28a745; }
                 .closed { border-left: 4px solid #dc3545; }
             </style>
@@ -130,48 +68,15 @@ class EmailService:
                 <h2>🔄 Recent Pull Request Activity</h2>
                 <p>Repository: {{ repo_name }}</p>
             </div>
-            
+
             <p>The following pull requests were recently processed:</p>
-            
-            {% for pr in prs %}
-            <div class="pr {% if pr.merged_at %}merged{% elif pr.closed_at %}closed{% endif %}">
-                <div class="pr-title">
-                    <a href="{{ pr.html_url }}" class="pr-link">#{{ pr.number }} - {{ pr.title }}</a>
-                </div>
-                <div class="pr-meta">
-                    <strong>Status:</strong> 
-                    {% if pr.merged_at %}
-                    <span style="color: #28a745;">✅ Merged</span>
-                    {% elif pr.closed_at %}
-                    <span style="color: #dc3545;">❌ Closed</span>
-                    {% else %}
-                    <span style="color: #ffc107;">⏳ Open</span>
-                    {% endif %}<br>
-                    {% if pr.merged_at %}
-                    <strong>Merged:</strong> {{ pr.merged_at.strftime('%Y-%m-%d %H:%M') }}<br>
-                    {% elif pr.closed_at %}
-                    <strong>Closed:</strong> {{ pr.closed_at.strftime('%Y-%m-%d %H:%M') }}<br>
-                    {% endif %}
-                    {% if pr.labels %}
-                    <strong>Labels:</strong> 
-                    {% for label in pr.labels %}
-                    <span style="background-color: #{{ label.color }}; color: white; padding: 2px 6px; border-radius: 3px; font-size: 12px;">{{ label.name }}</span>
-                    {% endfor %}<br>
-                    {% endif %}
-                    {% if pr.assignees %}
-                    <strong>Assignees:</strong> 
-                    {% for assignee in pr.assignees %}
-                    {{ assignee.login }}{% if not loop.last %}, {% endif %}
-                    {% endfor %}
-                    {% endif %}
-                </div>
-            </div>
-            {% endfor %}
-            
+
+            {{ pr_blocks }}
+
             <div class="repo-link">
                 <a href="{{ repo_url }}" class="pr-link">View Repository on GitHub</a>
             </div>
-            
+
             <hr>
             <p style="color: #666; font-size: 12px;">
                 This email was sent by the Repository Monitor Agent on {{ datetime.now().strftime('%Y-%m-%d %H:%M:%S') }}
@@ -179,34 +84,210 @@ class EmailService:
         </body>
         </html>
         """)
+
+
+def _render_labels(labels: List[Dict]) -> str:
+    """Render label badges as one pre-joined HTML fragment."""
+    if not labels:
+        return ''
+    # Only the background color varies per label; the shared styling
+    # lives in the templates' .label class so each badge stays short
+    spans = ''.join(
+        f'<span class="label" style="background-color: #{label["color"]}">'
+        f'{html.escape(label["name"])}</span>'
+        for label in labels
+    )
+    return f'<strong>Labels:</strong> {spans}<br>'
+
+
+def _render_assignees(assignees: List[Dict]) -> str:
+    """Render the assignee list as one pre-joined HTML fragment."""
+    if not assignees:
+        return ''
+    names = ', '.join(html.escape(assignee['login']) for assignee in assignees)
+    return f'<strong>Assignees:</strong> {names}'
+
+
+def _render_issue_block(issue) -> str:
+    """Render one issue card as plain HTML."""
+    return (
+        '<div class="issue">'
+        f'<div class="issue-title"><a href="{issue.html_url}" class="issue-link">'
+        f'#{issue.number} - {html.escape(issue.title)}</a></div>'
+        '<div class="issue-meta">'
+        f'<strong>Age:</strong> {issue.age_days} days<br>'
+        f'<strong>Created:</strong> {issue.created_at.strftime("%Y-%m-%d %H:%M")}<br>'
+        f'<strong>Last Updated:</strong> {issue.updated_at.strftime("%Y-%m-%d %H:%M")}<br>'
+        f'{_render_labels(issue.labels)}'
+        f'{_render_assignees(issue.assignees)}'
+        '</div></div>'
+    )
+
+
+def _render_pr_block(pr) -> str:
+    """Render one pull request card as plain HTML."""
+    if pr.merged_at:
+        css_class = 'pr merged'
+        status = '<span style="color: #28a745;">✅ Merged</span>'
+        processed = f'<strong>Merged:</strong> {pr.merged_at.strftime("%Y-%m-%d %H:%M")}<br>'
+    elif pr.closed_at:
+        css_class = 'pr closed'
+        status = '<span style="color: #dc3545;">❌ Closed</span>'
+        processed = f'<strong>Closed:</strong> {pr.closed_at.strftime("%Y-%m-%d %H:%M")}<br>'
+    else:
+        css_class = 'pr'
+        status = '<span style="color: #ffc107;">⏳ Open</span>'
+        processed = ''
+    return (
+        f'<div class="{css_class}">'
+        f'<div class="pr-title"><a href="{pr.html_url}" class="pr-link">'
+        f'#{pr.number} - {html.escape(pr.title)}</a></div>'
+        '<div class="pr-meta">'
+        f'<strong>Status:</strong> {status}<br>'
+        f'{processed}'
+        f'{_render_labels(pr.labels)}'
+        f'{_render_assignees(pr.assignees)}'
+        '</div></div>'
+    )
+
+
+class EmailService:
+    """Service for sending email notifications."""
+    
+    def __init__(self, smtp_host: str, smtp_port: int, username: str, password: str):
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self._smtp = None  # persistent connection while used as a context manager
+        self._persistent = False
+        self._smtp_lock = threading.Lock()  # smtplib sessions aren't thread-safe
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP connection."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        server.starttls()
+        server.login(self.username, self.password)
+        return server
+
+    def __enter__(self) -> 'EmailService':
+        """Reuse one SMTP connection for every send inside the block.
+
+        Connecting per email pays DNS + TCP + STARTTLS + AUTH round-trips
+        each time; a workflow run can send two emails back to back. The
+        connection is opened lazily on the first send, so runs that send
+        nothing cost nothing.
+        """
+        self._persistent = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._persistent = False
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def send_issue_alert(self, recipients: List[str], issues: List[Dict], 
+                        repo_name: str, repo_url: str, threshold_days: int) -> bool:
+        """Send email alert for issues that have been open beyond the threshold."""
+        
+        subject = f"[ALERT] Issues Open Beyond {threshold_days} Days - {repo_name}"
+        
+        # Create email content
+        content = self._create_issue_alert_content(issues, repo_name, repo_url, threshold_days)
+        
+        return self._send_email(recipients, subject, content)
+    
+    def send_pr_notification(self, recipients: List[str], prs: List[Dict], 
+                           repo_name: str, repo_url: str) -> bool:
+        """Send email notification for recently merged pull requests."""
+        
+        subject = f"[UPDATE] Pull Requests Merged - {repo_name}"
         
-        return template.render(
-            prs=prs,
+        # Create email content
+        content = self._create_pr_notification_content(prs, repo_name, repo_url)
+        
+        return self._send_email(recipients, subject, content)
+    
+    def _create_issue_alert_content(self, issues: List[Dict], repo_name: str, 
+                                  repo_url: str, threshold_days: int) -> str:
+        """Create HTML content for issue alert email."""
+        # Stream the render into a buffer chunk by chunk; render() builds
+        # the whole document through repeated string concatenation, which
+        # hurts on large issue lists
+        buffer = io.StringIO()
+        _ISSUE_ALERT_TEMPLATE.stream(
+            # Per-issue cards are pre-rendered in Python; the template
+            # only fills the outer shell, so Jinja does no per-item work
+            issue_blocks=''.join(map(_render_issue_block, issues)),
+            repo_name=repo_name,
+            repo_url=repo_url,
+            threshold_days=threshold_days,
+            datetime=datetime
+        ).dump(buffer)
+        return buffer.getvalue()
+
+    def _create_pr_notification_content(self, prs: List[Dict], repo_name: str, repo_url: str) -> str:
+        """Create HTML content for PR notification email."""
+        buffer = io.StringIO()
+        _PR_NOTIFICATION_TEMPLATE.stream(
+            pr_blocks=''.join(map(_render_pr_block, prs)),
             repo_name=repo_name,
             repo_url=repo_url,
             datetime=datetime
-        )
+        ).dump(buffer)
+        return buffer.getvalue()
     
+    def _build_message(self, recipients: List[str], subject: str, content: str,
+                       server: smtplib.SMTP) -> MIMEMultipart:
+        """Build the MIME message, skipping base64 when the server allows.
+
+        With 8BITMIME the HTML goes over the wire as raw UTF-8 instead of
+        being run through the base64 encoder, which matters for the large
+        bodies long issue lists produce.
+        """
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.username
+        msg['To'] = ', '.join(recipients)
+
+        if '8bitmime' in getattr(server, 'esmtp_features', {}):
+            html_part = MIMENonMultipart('text', 'html', charset='utf-8')
+            html_part.set_payload(content.encode('utf-8'))
+            html_part['Content-Transfer-Encoding'] = '8bit'
+        else:
+            html_part = MIMEText(content, 'html')
+        msg.attach(html_part)
+        return msg
+
     def _send_email(self, recipients: List[str], subject: str, content: str) -> bool:
         """Send email using SMTP."""
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.username
-            msg['To'] = ', '.join(recipients)
-            
-            # Attach HTML content
-            html_part = MIMEText(content, 'html')
-            msg.attach(html_part)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
-            
+            # Send email, reusing the persistent connection when inside a
+            # `with email_service:` block. The message is built after the
+            # connection is up so encoding can adapt to server features.
+            if self._persistent:
+                with self._smtp_lock:
+                    if self._smtp is None:
+                        self._smtp = self._connect()
+                    else:
+                        try:
+                            self._smtp.noop()
+                        except Exception:
+                            # Server dropped the idle connection; reconnect once
+                            self._smtp = self._connect()
+                    msg = self._build_message(recipients, subject, content, self._smtp)
+                    self._smtp.send_message(msg)
+            else:
+                with self._connect() as server:
+                    msg = self._build_message(recipients, subject, content, server)
+                    server.send_message(msg)
+
             return True
-            
+
         except Exception as e:
             print(f"Failed to send email: {e}")
             return False 
\ No newline at end of file
@@ -1,60 +1,319 @@
-from datetime import datetime, timedelta
-from typing import List, Dict
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Tuple
+from urllib.parse import urlencode, urlparse, parse_qs
+import requests
 from github import Github
-from .state import Issue, PullRequest
+from .state import Issue, PullRequest, IssueTable
+
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# On-disk store for ETags + response bodies so unchanged responses can be
+# served from cache via 304 Not Modified (which GitHub doesn't count
+# against the primary rate limit)
+_ETAG_CACHE_PATH = os.path.expanduser("~/.cache/repo_monitor/etags.json")
+
+# Single query that fetches repository metadata, open issues and recently
+# updated PRs in one round trip instead of three REST calls.
+_DASHBOARD_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    description
+    url
+    stargazerCount
+    forkCount
+    openIssueCount: issues(states: OPEN) { totalCount }
+    issues(states: OPEN, first: 100) {
+      nodes {
+        number title state createdAt updatedAt url
+        labels(first: 20) { nodes { name color } }
+        assignees(first: 10) { nodes { login avatarUrl } }
+      }
+    }
+    pullRequests(states: [MERGED, CLOSED], first: 50,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        number title state mergedAt closedAt url
+        labels(first: 20) { nodes { name color } }
+        assignees(first: 10) { nodes { login avatarUrl } }
+      }
+    }
+  }
+}
+"""
+
+
+def _parse_graphql_datetime(value):
+    """Parse a GraphQL ISO-8601 timestamp into a naive UTC datetime."""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class GitHubClient:
     """Client for interacting with GitHub API."""
-    
+
     def __init__(self, token: str):
+        self.token = token
         self.github = Github(token)
-    
-    def get_open_issues(self, owner: str, repo_name: str) -> List[Issue]:
-        """Fetch all open issues from a repository."""
-        repo = self.github.get_repo(f"{owner}/{repo_name}")
-        issues = []
-        
-        for issue in repo.get_issues(state='open'):
-            issue_data = Issue(
-                number=issue.number,
-                title=issue.title,
-                state=issue.state,
-                created_at=issue.created_at,
-                updated_at=issue.updated_at,
-                html_url=issue.html_url,
-                labels=[{"name": label.name, "color": label.color} for label in issue.labels],
-                assignees=[{"login": assignee.login, "avatar_url": assignee.avatar_url} for assignee in issue.assignees]
+        self._etag_cache = self._load_etag_cache()
+        self._etag_lock = threading.Lock()  # page fetches update the cache concurrently
+        self._etag_dirty = False
+
+        # One keep-alive session for all REST/GraphQL calls so TCP/TLS
+        # handshakes are reused instead of re-established per request
+        self._session = requests.Session()
+        self._session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16))
+        self._session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json"
+        })
+
+    def _load_etag_cache(self) -> Dict:
+        """Load the persisted ETag cache; missing/corrupt files start fresh."""
+        try:
+            with open(_ETAG_CACHE_PATH, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _flush_etag_cache(self) -> None:
+        """Persist the ETag cache to disk if it changed (best effort).
+
+        Called once per logical fetch rather than per request: the cache
+        holds full response bodies, so serializing it after every page of
+        a multi-page fetch would rewrite megabytes per page while the
+        pool's other page fetches wait on the lock.
+        """
+        with self._etag_lock:
+            if not self._etag_dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(_ETAG_CACHE_PATH), exist_ok=True)
+                with open(_ETAG_CACHE_PATH, 'w') as file:
+                    json.dump(self._etag_cache, file)
+                self._etag_dirty = False
+            except OSError:
+                pass
+
+    def _conditional_get(self, url: str, params: Dict = None) -> Tuple:
+        """GET a REST endpoint with If-None-Match conditional caching.
+
+        Sends the cached ETag with the request; on 304 Not Modified the
+        cached body is returned without any JSON parsing, and the request
+        does not count against the rate limit. Returns (body, last_page),
+        where last_page comes from the response's Link header (1 when the
+        result fits a single page).
+        """
+        key = url + ('?' + urlencode(sorted(params.items())) if params else '')
+        headers = {}
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        response = self._session.get(url, params=params, headers=headers, timeout=30)
+        if response.status_code == 304 and cached:
+            return cached[1], (cached[2] if len(cached) > 2 else 1)
+        response.raise_for_status()
+
+        body = response.json()
+        last_link = response.links.get('last')
+        last_page = int(parse_qs(urlparse(last_link['url']).query)['page'][0]) if last_link else 1
+
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = [etag, body, last_page]
+                self._etag_dirty = True
+        return body, last_page
+
+    def graphql_dashboard_snapshot(self, owner: str, repo_name: str,
+                                   lookback_hours: int = 24) -> Tuple[Dict, List[Issue], List[PullRequest]]:
+        """Fetch repo info, open issues and recent PRs in a single GraphQL request.
+
+        Returns the same shapes as get_repo_info, get_open_issues and
+        get_recent_prs, but with one HTTP round trip instead of three.
+        """
+        response = self._session.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": _DASHBOARD_QUERY, "variables": {"owner": owner, "name": repo_name}},
+            timeout=30
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+
+        data = payload["data"]["repository"]
+
+        repo_info = {
+            "name": data["name"],
+            "full_name": data["nameWithOwner"],
+            "description": data["description"],
+            "html_url": data["url"],
+            "open_issues_count": data["openIssueCount"]["totalCount"],
+            "stargazers_count": data["stargazerCount"],
+            "forks_count": data["forkCount"]
+        }
+
+        issues = [
+            Issue(
+                number=node["number"],
+                title=node["title"],
+                state=node["state"].lower(),
+                created_at=_parse_graphql_datetime(node["createdAt"]),
+                updated_at=_parse_graphql_datetime(node["updatedAt"]),
+                html_url=node["url"],
+                labels=[{"name": label["name"], "color": label["color"]} for label in node["labels"]["nodes"]],
+                assignees=[{"login": assignee["login"], "avatar_url": assignee["avatarUrl"]} for assignee in node["assignees"]["nodes"]],
+                # Join the projected names once here so display loops don't
+                # rebuild the strings per render
+                labels_str=', '.join(label["name"] for label in node["labels"]["nodes"]),
+                assignees_str=', '.join(assignee["login"] for assignee in node["assignees"]["nodes"])
             )
-            issues.append(issue_data)
-        
-        return issues
-    
+            for node in data["issues"]["nodes"]
+        ]
+
+        # Filter PRs client-side to the lookback window, matching get_recent_prs
+        lookback_time = datetime.utcnow() - timedelta(hours=lookback_hours)
+        prs = []
+        for node in data["pullRequests"]["nodes"]:
+            merged_at = _parse_graphql_datetime(node["mergedAt"])
+            closed_at = _parse_graphql_datetime(node["closedAt"])
+            if not ((merged_at and merged_at >= lookback_time) or
+                    (closed_at and closed_at >= lookback_time and not merged_at)):
+                continue
+            prs.append(PullRequest(
+                number=node["number"],
+                title=node["title"],
+                state=node["state"].lower(),
+                merged_at=merged_at,
+                closed_at=closed_at,
+                html_url=node["url"],
+                labels=[{"name": label["name"], "color": label["color"]} for label in node["labels"]["nodes"]],
+                assignees=[{"login": assignee["login"], "avatar_url": assignee["avatarUrl"]} for assignee in node["assignees"]["nodes"]],
+                labels_str=', '.join(label["name"] for label in node["labels"]["nodes"]),
+                assignees_str=', '.join(assignee["login"] for assignee in node["assignees"]["nodes"])
+            ))
+
+        return repo_info, issues, prs
+
+    @staticmethod
+    def _issue_from_rest(item: Dict) -> Issue:
+        """Build an Issue model from a REST API issue object."""
+        return Issue(
+            number=item["number"],
+            title=item["title"],
+            state=item["state"],
+            created_at=_parse_graphql_datetime(item["created_at"]),
+            updated_at=_parse_graphql_datetime(item["updated_at"]),
+            html_url=item["html_url"],
+            labels=[{"name": label["name"], "color": label["color"]} for label in item["labels"]],
+            assignees=[{"login": assignee["login"], "avatar_url": assignee["avatar_url"]} for assignee in item["assignees"]]
+        )
+
+    def get_open_issues(self, owner: str, repo_name: str) -> List[Issue]:
+        """Fetch all open issues from a repository.
+
+        Uses 100-item pages (PyGithub's lazy iteration fetches 30 at a
+        time) and, when the first response's Link header shows more
+        pages, fetches the rest concurrently — the total wait becomes one
+        round trip plus the slowest remaining page instead of their sum.
+        Every page goes through the ETag cache, so polling a repo whose
+        issues haven't changed is answered with 304s that cost no rate
+        limit and skip JSON parsing entirely.
+        """
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo_name}/issues"
+        params = {"state": "open", "per_page": 100}
+
+        first_body, last_page = self._conditional_get(url, {**params, "page": 1})
+        pages = [first_body]
+
+        if last_page > 1:
+            def fetch_page(page: int) -> List[Dict]:
+                body, _ = self._conditional_get(url, {**params, "page": page})
+                return body
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                pages.extend(pool.map(fetch_page, range(2, last_page + 1)))
+
+        self._flush_etag_cache()
+        return [self._issue_from_rest(item) for page in pages for item in page]
+
+    def get_open_issues_table(self, owner: str, repo_name: str) -> IssueTable:
+        """Fetch open issues as a column-oriented IssueTable for bulk analytics."""
+        return IssueTable.from_issues(self.get_open_issues(owner, repo_name))
+
     def get_recent_prs(self, owner: str, repo_name: str, lookback_hours: int = 24) -> List[PullRequest]:
-        """Fetch recently merged or closed pull requests."""
+        """Fetch recently merged or closed pull requests.
+
+        The search API returns only the PRs closed inside the lookback
+        window, so a typical 24h window on a busy repo costs one request
+        instead of paging through PR history. Falls back to paginated
+        listing if the search request fails.
+        """
+        lookback_time = datetime.now() - timedelta(hours=lookback_hours)
+
+        try:
+            response = self._session.get(
+                f"{GITHUB_API_URL}/search/issues",
+                params={
+                    "q": f"repo:{owner}/{repo_name} is:pr "
+                         f"closed:>={lookback_time.strftime('%Y-%m-%dT%H:%M:%S')}",
+                    "per_page": 100
+                },
+                timeout=30
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            return self._get_recent_prs_paginated(owner, repo_name, lookback_time)
+
+        prs = []
+        for item in response.json().get("items", []):
+            merged_at = _parse_graphql_datetime((item.get("pull_request") or {}).get("merged_at"))
+            closed_at = _parse_graphql_datetime(item.get("closed_at"))
+            # Same predicate as the paginated path: merged in the window,
+            # or closed without merging in the window
+            if not ((merged_at and merged_at >= lookback_time) or
+                    (closed_at and closed_at >= lookback_time and not merged_at)):
+                continue
+            prs.append(PullRequest(
+                number=item["number"],
+                title=item["title"],
+                state=item["state"],
+                merged_at=merged_at,
+                closed_at=closed_at,
+                html_url=item["html_url"],
+                labels=[{"name": label["name"], "color": label["color"]} for label in item.get("labels", [])],
+                assignees=[{"login": assignee["login"], "avatar_url": assignee["avatar_url"]} for assignee in item.get("assignees", [])]
+            ))
+
+        return prs
+
+    def _get_recent_prs_paginated(self, owner: str, repo_name: str,
+                                  lookback_time: datetime) -> List[PullRequest]:
+        """Paginated fallback for get_recent_prs."""
         repo = self.github.get_repo(f"{owner}/{repo_name}")
         prs = []
-        
-        # Calculate the lookback time
-        lookback_time = datetime.now() - timedelta(hours=lookback_hours)
-        
-        for pr in repo.get_pulls(state='all'):
-            # Only include PRs that were merged or closed within the lookback period
-            if pr.merged_at and pr.merged_at >= lookback_time:
-                pr_data = PullRequest(
-                    number=pr.number,
-                    title=pr.title,
-                    state=pr.state,
-                    merged_at=pr.merged_at,
-                    closed_at=pr.closed_at,
-                    html_url=pr.html_url,
-                    labels=[{"name": label.name, "color": label.color} for label in pr.labels],
-                    assignees=[{"login": assignee.login, "avatar_url": assignee.avatar_url} for assignee in pr.assignees]
-                )
-                prs.append(pr_data)
-            elif pr.closed_at and pr.closed_at >= lookback_time and not pr.merged_at:
-                # Include closed but not merged PRs
-                pr_data = PullRequest(
+
+        # Walk PRs newest-update-first and stop paginating as soon as we
+        # fall out of the lookback window, instead of scanning all history
+        for pr in repo.get_pulls(state='all', sort='updated', direction='desc'):
+            if pr.updated_at and pr.updated_at < lookback_time:
+                break
+            # Only include PRs that were merged (or closed without
+            # merging) within the lookback period
+            if ((pr.merged_at and pr.merged_at >= lookback_time) or
+                    (pr.closed_at and pr.closed_at >= lookback_time and not pr.merged_at)):
+                prs.append(PullRequest(
                     number=pr.number,
                     title=pr.title,
                     state=pr.state,
@@ -63,20 +322,20 @@ class GitHubClient:
                     html_url=pr.html_url,
                     labels=[{"name": label.name, "color": label.color} for label in pr.labels],
                     assignees=[{"login": assignee.login, "avatar_url": assignee.avatar_url} for assignee in pr.assignees]
-                )
-                prs.append(pr_data)
-        
+                ))
+
         return prs
     
     def get_repo_info(self, owner: str, repo_name: str) -> Dict:
         """Get basic repository information."""
-        repo = self.github.get_repo(f"{owner}/{repo_name}")
+        repo, _ = self._conditional_get(f"{GITHUB_API_URL}/repos/{owner}/{repo_name}")
+        self._flush_etag_cache()
         return {
-            "name": repo.name,
-            "full_name": repo.full_name,
-            "description": repo.description,
-            "html_url": repo.html_url,
-            "open_issues_count": repo.open_issues_count,
-            "stargazers_count": repo.stargazers_count,
-            "forks_count": repo.forks_count
+            "name": repo["name"],
+            "full_name": repo["full_name"],
+            "description": repo["description"],
+            "html_url": repo["html_url"],
+            "open_issues_count": repo["open_issues_count"],
+            "stargazers_count": repo["stargazers_count"],
+            "forks_count": repo["forks_count"]
         } 
\ No newline at end of file
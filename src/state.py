@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Optional
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoMonitorState:
     """State for the repository monitoring workflow."""
     
@@ -17,9 +18,10 @@ class RepoMonitorState:
     issue_threshold_days: int = 7
     email_recipients: List[str] = field(default_factory=list)
     
-    # Current repository state
-    open_issues: List[Dict] = field(default_factory=list)
-    recent_prs: List[Dict] = field(default_factory=list)
+    # Current repository state (validated model instances, constructed
+    # once by the GitHub client and reused by every downstream node)
+    open_issues: List['Issue'] = field(default_factory=list)
+    recent_prs: List['PullRequest'] = field(default_factory=list)
     
     # Email tracking
     last_email_sent: Optional[datetime] = None
@@ -34,12 +36,20 @@ class RepoMonitorState:
     # Workflow state
     should_send_issue_alert: bool = False
     should_send_pr_notification: bool = False
-    alert_issues: List[Dict] = field(default_factory=list)
-    notification_prs: List[Dict] = field(default_factory=list)
+    alert_issues: List['Issue'] = field(default_factory=list)
+    notification_prs: List['PullRequest'] = field(default_factory=list)
+
+    # Wall-clock time captured once at the start of each run and reused
+    # by every node that needs "now"
+    run_started_at: Optional[datetime] = None
 
 
 class Issue(BaseModel):
     """GitHub issue model."""
+    # Instances are never mutated after the client builds them; frozen
+    # models get cheaper attribute handling and are hashable
+    model_config = ConfigDict(frozen=True)
+
     number: int
     title: str
     state: str
@@ -48,7 +58,11 @@ class Issue(BaseModel):
     html_url: str
     labels: List[Dict] = []
     assignees: List[Dict] = []
-    
+    # Pre-joined display strings, populated when the source query projects
+    # them (e.g. the GraphQL dashboard snapshot)
+    labels_str: Optional[str] = None
+    assignees_str: Optional[str] = None
+
     @property
     def age_days(self) -> int:
         """Calculate how many days the issue has been open."""
@@ -57,6 +71,8 @@ class Issue(BaseModel):
 
 class PullRequest(BaseModel):
     """GitHub pull request model."""
+    model_config = ConfigDict(frozen=True)
+
     number: int
     title: str
     state: str
@@ -65,8 +81,54 @@ class PullRequest(BaseModel):
     html_url: str
     labels: List[Dict] = []
     assignees: List[Dict] = []
-    
+    labels_str: Optional[str] = None
+    assignees_str: Optional[str] = None
+
     @property
     def is_merged(self) -> bool:
         """Check if the PR was merged."""
-        return self.merged_at is not None 
\ No newline at end of file
+        return self.merged_at is not None
+
+
+class IssueTable:
+    """Column-oriented (structure-of-arrays) view of a list of issues.
+
+    Bulk analytics like age filtering become single vectorized NumPy
+    operations over the timestamp column instead of per-object attribute
+    access and datetime arithmetic.
+    """
+
+    __slots__ = ('numbers', 'titles', 'created_ts', 'html_urls', 'labels_str', 'assignees_str')
+
+    def __init__(self, numbers, titles, created_ts, html_urls, labels_str, assignees_str):
+        self.numbers = numbers
+        self.titles = titles
+        self.created_ts = created_ts
+        self.html_urls = html_urls
+        self.labels_str = labels_str
+        self.assignees_str = assignees_str
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @classmethod
+    def from_issues(cls, issues: List['Issue']) -> 'IssueTable':
+        """Build the column store from a list of Issue models."""
+        count = len(issues)
+        return cls(
+            numbers=np.fromiter((issue.number for issue in issues), dtype=np.int64, count=count),
+            titles=[issue.title for issue in issues],
+            created_ts=np.fromiter((issue.created_at.timestamp() for issue in issues),
+                                   dtype=np.int64, count=count),
+            html_urls=[issue.html_url for issue in issues],
+            labels_str=[issue.labels_str if issue.labels_str is not None
+                        else ', '.join(label['name'] for label in issue.labels)
+                        for issue in issues],
+            assignees_str=[issue.assignees_str if issue.assignees_str is not None
+                           else ', '.join(assignee['login'] for assignee in issue.assignees)
+                           for issue in issues]
+        )
+
+    def age_days(self, now: datetime) -> np.ndarray:
+        """Vectorized issue age in whole days relative to now."""
+        return (int(now.timestamp()) - self.created_ts) // 86400 
\ No newline at end of file
@@ -1,7 +1,21 @@
+import asyncio
 from typing import Dict, Any
+import numpy as np
+
+# JIT-compile the age filter when Numba is installed; the numpy
+# expression is the fallback and computes the identical mask
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _filter_ages(created_ts, now_ts, threshold_days):
+        return (now_ts - created_ts) // 86400 >= threshold_days
+except ImportError:
+    def _filter_ages(created_ts, now_ts, threshold_days):
+        return (now_ts - created_ts) // 86400 >= threshold_days
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
-from .state import RepoMonitorState, Issue, PullRequest
+from .state import RepoMonitorState
 from .github_client import GitHubClient
 from .email_service import EmailService
 from datetime import datetime
@@ -72,22 +86,33 @@ class RepoMonitorWorkflow:
         
         return workflow.compile()
     
-    def _fetch_data_node(self, state: RepoMonitorState) -> RepoMonitorState:
+    async def _fetch_data_node(self, state: RepoMonitorState) -> RepoMonitorState:
         """Fetch current repository data."""
         print(f"Fetching data for {state.repo_owner}/{state.repo_name}...")
-        
-        # Fetch open issues
-        issues = self.github_client.get_open_issues(state.repo_owner, state.repo_name)
-        state.open_issues = [issue.dict() for issue in issues]
-        
-        # Fetch recent PRs
-        prs = self.github_client.get_recent_prs(
-            state.repo_owner, 
-            state.repo_name, 
-            self.config['monitoring']['pr_lookback_hours']
+
+        # One clock read per run; downstream nodes reuse this timestamp
+        state.run_started_at = datetime.now()
+
+        # The two GitHub calls are independent network I/O, so overlap
+        # them instead of paying their latencies back to back
+        issues, prs = await asyncio.gather(
+            asyncio.to_thread(
+                self.github_client.get_open_issues,
+                state.repo_owner,
+                state.repo_name
+            ),
+            asyncio.to_thread(
+                self.github_client.get_recent_prs,
+                state.repo_owner,
+                state.repo_name,
+                self.config['monitoring']['pr_lookback_hours']
+            )
         )
-        state.recent_prs = [pr.dict() for pr in prs]
-        
+        # Keep the validated model instances; dumping to dicts only to
+        # rebuild models in the analyzers re-validates every field
+        state.open_issues = issues
+        state.recent_prs = prs
+
         print(f"Found {len(state.open_issues)} open issues and {len(state.recent_prs)} recent PRs")
         return state
     
@@ -95,16 +120,27 @@ class RepoMonitorWorkflow:
         """Analyze issues to determine if alerts should be sent."""
         print("Analyzing issues for alerts...")
         
-        # Find issues that exceed the threshold
-        alert_issues = []
-        for issue_data in state.open_issues:
-            issue = Issue(**issue_data)
-            if issue.age_days >= state.issue_threshold_days:
-                alert_issues.append(issue_data)
-        
+        # Find issues that exceed the threshold. One clock read per run;
+        # on large repos the ages are computed as a single vectorized op
+        # over the timestamp column, below 64 issues the array setup
+        # costs more than it saves
+        issues = state.open_issues
+        now = state.run_started_at or datetime.now()
+        if len(issues) >= 64:
+            created_ts = np.fromiter((issue.created_at.timestamp() for issue in issues),
+                                     dtype=np.int64, count=len(issues))
+            mask = _filter_ages(created_ts, np.int64(now.timestamp()),
+                                state.issue_threshold_days)
+            alert_issues = [issues[i] for i in np.flatnonzero(mask)]
+        else:
+            alert_issues = [
+                issue for issue in issues
+                if (now - issue.created_at).days >= state.issue_threshold_days
+            ]
+
         state.alert_issues = alert_issues
         state.should_send_issue_alert = len(alert_issues) > 0
-        
+
         print(f"Found {len(alert_issues)} issues that exceed the {state.issue_threshold_days}-day threshold")
         return state
     
@@ -113,15 +149,14 @@ class RepoMonitorWorkflow:
         print("Analyzing PRs for notifications...")
         
         # Find PRs that were recently merged or closed
-        notification_prs = []
-        for pr_data in state.recent_prs:
-            pr = PullRequest(**pr_data)
-            if pr.is_merged or pr.closed_at:
-                notification_prs.append(pr_data)
-        
+        notification_prs = [
+            pr for pr in state.recent_prs
+            if pr.is_merged or pr.closed_at
+        ]
+
         state.notification_prs = notification_prs
         state.should_send_pr_notification = len(notification_prs) > 0
-        
+
         print(f"Found {len(notification_prs)} PRs that were recently processed")
         return state
     
@@ -133,13 +168,14 @@ class RepoMonitorWorkflow:
         """Determine if PR notification should be sent."""
         return "send_notification" if state.should_send_pr_notification else "skip"
     
-    def _send_issue_alert_node(self, state: RepoMonitorState) -> RepoMonitorState:
+    async def _send_issue_alert_node(self, state: RepoMonitorState) -> RepoMonitorState:
         """Send issue alert email."""
         print("Sending issue alert email...")
-        
+
         repo_url = f"https://github.com/{state.repo_owner}/{state.repo_name}"
-        
-        success = self.email_service.send_issue_alert(
+
+        success = await asyncio.to_thread(
+            self.email_service.send_issue_alert,
             recipients=state.email_recipients,
             issues=state.alert_issues,
             repo_name=state.repo_name,
@@ -149,19 +185,20 @@ class RepoMonitorWorkflow:
         
         if success:
             print("Issue alert email sent successfully")
-            state.sent_notifications.append(f"issue_alert_{datetime.now().isoformat()}")
+            state.sent_notifications.append(f"issue_alert_{state.run_started_at.isoformat()}")
         else:
             print("Failed to send issue alert email")
         
         return state
     
-    def _send_pr_notification_node(self, state: RepoMonitorState) -> RepoMonitorState:
+    async def _send_pr_notification_node(self, state: RepoMonitorState) -> RepoMonitorState:
         """Send PR notification email."""
         print("Sending PR notification email...")
-        
+
         repo_url = f"https://github.com/{state.repo_owner}/{state.repo_name}"
-        
-        success = self.email_service.send_pr_notification(
+
+        success = await asyncio.to_thread(
+            self.email_service.send_pr_notification,
             recipients=state.email_recipients,
             prs=state.notification_prs,
             repo_name=state.repo_name,
@@ -170,7 +207,7 @@ class RepoMonitorWorkflow:
         
         if success:
             print("PR notification email sent successfully")
-            state.sent_notifications.append(f"pr_notification_{datetime.now().isoformat()}")
+            state.sent_notifications.append(f"pr_notification_{state.run_started_at.isoformat()}")
         else:
             print("Failed to send PR notification email")
         
@@ -182,17 +219,25 @@ class RepoMonitorWorkflow:
         
         # Update last email sent time if any emails were sent
         if state.sent_notifications:
-            state.last_email_sent = datetime.now()
-        
-        # Reset workflow flags
+            state.last_email_sent = state.run_started_at
+
+        # Reset workflow flags; clear() keeps list identity so the
+        # checkpointer doesn't see fresh objects to persist
         state.should_send_issue_alert = False
         state.should_send_pr_notification = False
-        state.alert_issues = []
-        state.notification_prs = []
+        state.alert_issues.clear()
+        state.notification_prs.clear()
         
         print("Workflow completed successfully")
         return state
     
     def run(self, initial_state: RepoMonitorState) -> RepoMonitorState:
-        """Run the workflow with the given initial state."""
-        return self.workflow.invoke(initial_state) 
\ No newline at end of file
+        """Run the workflow with the given initial state.
+
+        The email service is held open for the whole run so the issue
+        alert and PR notification reuse one SMTP connection. ainvoke lets
+        LangGraph schedule the parallel branches (both analyses, both
+        sends) concurrently instead of one after another.
+        """
+        with self.email_service:
+            return asyncio.run(self.workflow.ainvoke(initial_state)) 
\ No newline at end of file
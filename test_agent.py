@@ -8,7 +8,9 @@ This script tests the agent functionality without sending actual emails.
 import os
 import sys
 from datetime import datetime, timedelta
-from src import RepoMonitorState, Issue, PullRequest, GitHubClient, EmailService
+import numpy as np
+from src import RepoMonitorState, Issue, PullRequest, IssueTable, GitHubClient, EmailService
+from src.workflow import RepoMonitorWorkflow, _filter_ages
 
 
 def create_test_issues():
@@ -65,6 +67,86 @@ def create_test_prs():
     ]
 
 
+def make_test_corpus(n, now):
+    """Create a column-oriented (SoA) test corpus of n issues.
+
+    Returns one array per field instead of n dicts, matching the layout
+    the vectorized age analysis operates on.
+    """
+    ages = np.arange(n, dtype=np.int64) % 30  # ages 0..29 days, cycling
+    return {
+        "number": np.arange(1, n + 1, dtype=np.int64),
+        "created_ts": np.int64(now.timestamp()) - ages * 86400,
+    }
+
+
+def make_test_issue_models(corpus, now):
+    """Hydrate Issue models from a column-oriented test corpus."""
+    return [
+        Issue(
+            number=int(number),
+            title=f"Test Issue {number}",
+            state="open",
+            created_at=datetime.fromtimestamp(int(created_ts)),
+            updated_at=now,
+            html_url=f"https://github.com/test/repo/issues/{number}",
+        )
+        for number, created_ts in zip(corpus["number"], corpus["created_ts"])
+    ]
+
+
+def test_vectorized_age_analysis():
+    """Test the analyzer's vectorized path against a per-item reference."""
+    print("Testing vectorized age analysis...")
+
+    workflow = RepoMonitorWorkflow({
+        'repository': {'token': 'test-token'},
+        'email': {
+            'smtp_host': 'smtp.gmail.com',
+            'smtp_port': 587,
+            'username': 'test@example.com',
+            'password': 'test-password'
+        },
+        'monitoring': {'pr_lookback_hours': 24}
+    })
+
+    threshold_days = 7
+    now = datetime.now()
+    # 10 exercises the per-item path, the larger sizes the NumPy path
+    for n in (10, 100, 1000):
+        corpus = make_test_corpus(n, now)
+        issues = make_test_issue_models(corpus, now)
+
+        # Per-item reference the vectorized implementations must match
+        expected = [
+            issue.number for issue in issues
+            if (now - issue.created_at).days >= threshold_days
+        ]
+
+        state = RepoMonitorState(
+            repo_owner="test-org",
+            repo_name="test-repo",
+            github_token="test-token",
+            issue_threshold_days=threshold_days,
+            open_issues=issues,
+            run_started_at=now
+        )
+        state = workflow._analyze_issues_node(state)
+        flagged = [issue.number for issue in state.alert_issues]
+        assert flagged == expected, f"analyzer diverged from reference at n={n}"
+
+        # The standalone kernel and the column-store ages must agree too
+        table = IssueTable.from_issues(issues)
+        kernel_mask = _filter_ages(table.created_ts, np.int64(now.timestamp()), threshold_days)
+        table_mask = table.age_days(now) >= threshold_days
+        assert list(table.numbers[kernel_mask]) == expected, f"_filter_ages diverged at n={n}"
+        assert list(table.numbers[table_mask]) == expected, f"IssueTable.age_days diverged at n={n}"
+
+        print(f"n={n}: {len(flagged)} issues over the {threshold_days}-day threshold")
+
+    print("✅ Vectorized age analysis tests passed\n")
+
+
 def test_state_management():
     """Test the state management functionality."""
     print("Testing state management...")
@@ -106,8 +188,9 @@ def test_email_templates():
         password="test-password"
     )
     
-    # Test issue alert template
-    test_issues = create_test_issues()
+    # Test issue alert template (the builders take model instances, as
+    # the workflow passes them since the dict round-trip was removed)
+    test_issues = [Issue(**issue_data) for issue_data in create_test_issues()]
     issue_content = email_service._create_issue_alert_content(
         issues=test_issues,
         repo_name="test-repo",
@@ -116,7 +199,7 @@ def test_email_templates():
     )
     
     # Test PR notification template
-    test_prs = create_test_prs()
+    test_prs = [PullRequest(**pr_data) for pr_data in create_test_prs()]
     pr_content = email_service._create_pr_notification_content(
         prs=test_prs,
         repo_name="test-repo",
@@ -169,6 +252,7 @@ def main():
     print("=" * 50)
     
     try:
+        test_vectorized_age_analysis()
         test_state_management()
         test_email_templates()
         test_workflow_logic()